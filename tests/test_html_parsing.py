@@ -0,0 +1,41 @@
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("requests")
+
+import tiktok_scraper_simple as scraper
+
+
+def parse(html):
+    hashtags, seen = [], set()
+    scraper._parse_hashtags_from_dom(html.encode("utf-8"), hashtags, seen)
+    return hashtags
+
+
+def test_strategy_a_finds_tags_inside_inline_wrappers():
+    html = """
+    <html><body>
+      <div><b>#alpha</b></div>
+      <h3><strong>#beta</strong></h3>
+      <p><em># gamma</em></p>
+      <div><span>#</span><span>delta</span></div>
+      <span>#epsilon</span>
+      <li><b>#zeta</b></li>
+    </body></html>
+    """
+    assert parse(html) == ["#alpha", "#beta", "#gamma", "#delta", "#epsilon"]
+
+
+def test_strategy_a_dedupes_case_insensitively():
+    html = "<div><b>#Home</b></div><p>#home</p><span>#HOME</span>"
+    assert parse(html)[0] == "#Home"
+    assert [t.lower() for t in parse(html)].count("#home") == 1
+
+
+def test_strategy_b_reads_hashtag_links_when_text_is_sparse():
+    html = """
+    <a href="/business/creativecenter/hashtag/one/pc/en">One</a>
+    <a href="/business/creativecenter/hashtag/two/pc/en?x=1">Two</a>
+    <a href="/elsewhere">Nope</a>
+    """
+    assert parse(html) == ["#one", "#two"]
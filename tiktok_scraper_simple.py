@@ -9,15 +9,43 @@ Strategy (in priority order):
   3. Fall back to a curated static database (always works)
 
 Designed to run in GitHub Actions with zero browser dependencies.
-Only requires: requests, beautifulsoup4, pandas, openpyxl
+Only requires: requests, beautifulsoup4, pandas, openpyxl (lxml, orjson and httpx[http2] optional, for speed)
 """
 
+import argparse
+import hashlib
 import json
+import os
 import re
+import threading
 import time
 import requests
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http.cookiejar import MozillaCookieJar
+from itertools import chain
+from urllib.parse import urlsplit
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import lxml  # noqa: F401 — C-backed parser, much faster than html.parser
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+try:
+    import orjson  # Faster JSON decode/encode; stdlib json is used if missing
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+    import h2  # noqa: F401 — required by httpx for http2=True
+except ImportError:
+    httpx = None
 
 # ─────────────────────────────────────────────
 # Configuration
@@ -26,6 +54,26 @@ from bs4 import BeautifulSoup
 COUNTRY_CODE = ""          # Empty = all regions (matches the default Creative Center view)
 PERIOD = 7                 # 7-day trending window
 MAX_HASHTAGS = 100         # How many to try to fetch
+API_CONCURRENCY = 4        # Parallel industry requests in flight at once
+RATE_LIMIT_PER_SEC = 5     # Steady-state requests per second, per host
+RATE_LIMIT_BURST = 5       # Requests allowed back-to-back before the rate kicks in
+MAX_RETRY_AFTER = 60       # Longest Retry-After (seconds) we'll wait; longer = give up on that request
+
+# On-disk response cache so repeated runs inside the TTL skip the network.
+# The "All" feed moves fastest; per-industry lists are much more stable.
+CACHE_DIR = ".cache"
+CACHE_TTL_TRENDING = 1 * 3600    # seconds — general/trending ("All" industry, HTML page)
+CACHE_TTL_INDUSTRY = 24 * 3600   # seconds — individual industry lists
+
+# ETag / Last-Modified validators from the last successful HTML scrape,
+# sent back as conditional headers so an unchanged page costs a bare 304.
+HTML_VALIDATORS_FILE = os.path.join(CACHE_DIR, "html_validators.json")
+
+# Creative Center responses (normally just the API calls; the HTML page only
+# when the API's general list is short) set msToken / tt_webid cookies.
+# Keeping them between runs lets API calls skip the cold anti-bot path.
+# Lives under CACHE_DIR so the workflow's cache step carries it over.
+COOKIE_FILE = os.path.join(CACHE_DIR, "tiktok_cookies.txt")
 
 # TikTok Creative Center industry filter codes (from the site's dropdown)
 # These are the numeric IDs TikTok uses internally for industry filtering.
@@ -66,6 +114,10 @@ WEBSITE_KEY_MAP = {
     "Vehicle & Transportation": "auto",
 }
 
+# Patterns used when parsing the Creative Center page, compiled once
+_HASHTAG_HREF_RE = re.compile(r"/hashtag/([^/?]+)")                     # /hashtag/NAME/pc/en links
+_HASHTAG_JSON_RE_BYTES = re.compile(rb'"hashtag_name"\s*:\s*"([^"]+)"')  # embedded JSON, raw bytes
+
 # Standard headers to look like a normal browser
 HEADERS = {
     "User-Agent": (
@@ -78,6 +130,232 @@ HEADERS = {
     "Referer": "https://ads.tiktok.com/business/creativecenter/inspiration/popular/hashtag/pc/en",
 }
 
+# Transient statuses worth retrying (rate limits, 5xx)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# One shared session so every call to ads.tiktok.com reuses the same
+# keep-alive connections instead of paying a fresh TCP+TLS handshake.
+# Transient failures (rate limits, 5xx) are retried with backoff.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUSES,
+        raise_on_status=False,   # Hand the final response back so callers can log the status
+        respect_retry_after_header=False,   # _polite_get does a capped Retry-After wait instead
+    ),
+))
+SESSION.cookies = MozillaCookieJar(COOKIE_FILE)
+try:
+    SESSION.cookies.load(ignore_discard=True)
+except OSError:   # No cookie file yet (or an unreadable one) — start fresh
+    pass
+
+# When httpx[http2] is installed, the industry API fan-out is multiplexed
+# over a single HTTP/2 connection (one TLS handshake for every call).
+# Otherwise those calls go through SESSION like everything else.
+HTTP2_CLIENT = None
+if httpx is not None:
+    HTTP2_CLIENT = httpx.Client(
+        http2=True,
+        headers=HEADERS,
+        cookies=SESSION.cookies,   # Same jar object, so both clients see the same cookies
+        timeout=15,
+        limits=httpx.Limits(max_connections=1, max_keepalive_connections=1),
+    )
+
+
+# ─────────────────────────────────────────────
+# Helpers
+# ─────────────────────────────────────────────
+
+def _dedup_append(tag, out_list, seen_lower):
+    """Append `tag` to `out_list` unless a case-insensitive duplicate is already in `seen_lower`."""
+    key = tag.lower()
+    if key not in seen_lower:
+        seen_lower.add(key)
+        out_list.append(tag)
+
+
+class _TokenBucket:
+    """Thread-safe token bucket: refills at `rate` tokens/second, holds at most `burst`."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available (and any server-requested pause is over)."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                # No refill while paused — otherwise we'd burst the moment it ends
+                elapsed = now - max(self.updated, self.paused_until)
+                if elapsed > 0:
+                    self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+                self.updated = now
+
+                if now < self.paused_until:
+                    delay = self.paused_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                else:
+                    delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+
+    def pause(self, seconds):
+        """Hold every caller for `seconds`, e.g. after a 429 with Retry-After."""
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0
+
+
+_BUCKETS = {}
+_BUCKETS_LOCK = threading.Lock()
+
+
+def _retry_after_seconds(resp):
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds, or None."""
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def _polite_get(url, client=None, **kwargs):
+    """
+    client.get() (SESSION by default) behind a per-host token bucket. If the
+    server answers 429/503 with Retry-After, every thread hitting that host
+    waits it out, up to MAX_RETRY_AFTER seconds. SESSION retries inside its
+    adapter; other clients (the HTTP/2 one) are retried here on the same
+    statuses and on transport errors, with the same backoff.
+    """
+    if client is None:
+        client = SESSION
+    retries = 0 if client is SESSION else 3
+    # httpx has no adapter-level retry for dropped/reset connections (e.g. a
+    # GOAWAY on the shared HTTP/2 connection), so those are retried here too.
+    retry_errors = () if client is SESSION else (httpx.TransportError,)
+
+    host = urlsplit(url).hostname
+    with _BUCKETS_LOCK:
+        bucket = _BUCKETS.get(host)
+        if bucket is None:
+            bucket = _BUCKETS[host] = _TokenBucket(RATE_LIMIT_PER_SEC, RATE_LIMIT_BURST)
+
+    for attempt in range(retries + 1):
+        bucket.acquire()
+        try:
+            resp = client.get(url, **kwargs)
+        except retry_errors as e:
+            if attempt >= retries:
+                raise
+            print(f"  [Retry] {host}: {type(e).__name__}, retrying")
+            time.sleep(0.5 * 2 ** attempt)
+            continue
+        if resp.status_code not in RETRY_STATUSES:
+            return resp
+
+        delay = _retry_after_seconds(resp) if resp.status_code in (429, 503) else None
+        if delay and delay > MAX_RETRY_AFTER:
+            # Don't stall every worker (and the weekly job) on a long ban —
+            # fail this request so the caller falls back instead.
+            print(f"  [Rate limit] {host} asked us to wait {delay:.0f}s — giving up on this request")
+            return resp
+        if delay:
+            print(f"  [Rate limit] {host} asked us to wait {delay:.0f}s")
+            bucket.pause(delay)
+        elif attempt < retries:
+            time.sleep(0.5 * 2 ** attempt)
+    return resp
+
+
+# ─────────────────────────────────────────────
+# Response cache
+# ─────────────────────────────────────────────
+
+# Fetch times (epoch seconds) of every cache HIT this run, so the output can
+# say how old the served data really is
+_CACHE_HIT_FETCHED_AT = []
+
+
+def _cached(key, ttl, label, loader):
+    """
+    Return the cached value for `key` if it is younger than `ttl` seconds,
+    otherwise call `loader()` and cache its result. Failed loads (None or
+    empty) are never cached so the next run retries the network.
+    """
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    path = os.path.join(CACHE_DIR, f"{digest}.json")
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        if entry["expires_at"] > time.time():
+            _CACHE_HIT_FETCHED_AT.append(entry["fetched_at"])
+            print(f"  [{label}] cache HIT")
+            return entry["value"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    print(f"  [{label}] cache MISS")
+    value = loader()
+    if value:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                now = time.time()
+                json.dump({"fetched_at": now, "expires_at": now + ttl, "value": value}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"  [{label}] Could not write cache: {e}")
+    return value
+
+
+def _save_cookies():
+    """Write the session's cookie jar so the next run starts with warm cookies."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        SESSION.cookies.save(ignore_discard=True)
+    except OSError as e:
+        print(f"⚠️  Could not save cookies: {e}")
+
+
+def _load_html_validators():
+    """Read the stored ETag/Last-Modified entries, or {} if there are none yet."""
+    try:
+        with open(HTML_VALIDATORS_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_html_validators(validators):
+    """Persist ETag/Last-Modified entries for the next run's conditional request."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(HTML_VALIDATORS_FILE, "w", encoding="utf-8") as f:
+            json.dump(validators, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"  [HTML] Could not write validators: {e}")
+
 
 # ─────────────────────────────────────────────
 # Method 1: TikTok Creative Center Internal API
@@ -87,8 +365,20 @@ def fetch_via_api(industry_name="All", industry_id="", country_code="", period=7
     """
     Call TikTok Creative Center's internal API endpoint.
     This is the same endpoint the website's JavaScript calls.
+    Results are served from the on-disk cache while still fresh.
     Returns a list of hashtag strings, or None on failure.
     """
+    ttl = CACHE_TTL_INDUSTRY if industry_id else CACHE_TTL_TRENDING
+    return _cached(
+        f"api|{industry_id}|{country_code}|{period}|{limit}",
+        ttl,
+        f"API {industry_name}",
+        lambda: _fetch_via_api_live(industry_name, industry_id, country_code, period, limit),
+    )
+
+
+def _fetch_via_api_live(industry_name, industry_id, country_code, period, limit):
+    """Uncached API call behind fetch_via_api()."""
     url = "https://ads.tiktok.com/creative_radar_api/v1/popular_trend/hashtag/list"
 
     params = {
@@ -102,12 +392,12 @@ def fetch_via_api(industry_name="All", industry_id="", country_code="", period=7
         params["industry_id"] = industry_id
 
     try:
-        resp = requests.get(url, headers=HEADERS, params=params, timeout=15)
+        resp = _polite_get(url, client=HTTP2_CLIENT, params=params, timeout=15)
         if resp.status_code != 200:
             print(f"  [API] HTTP {resp.status_code} for {industry_name}")
             return None
 
-        data = resp.json()
+        data = orjson.loads(resp.content) if orjson else resp.json()
 
         # The API returns: { "code": 0, "data": { "list": [ { "hashtag_name": "...", ... }, ... ] } }
         if data.get("code") != 0:
@@ -142,8 +432,19 @@ def fetch_via_html(country_code="", period=7):
     """
     Fetch the Creative Center hashtags page and parse the SSR HTML.
     The page renders ~20 hashtags in the initial HTML without JavaScript.
+    Results are served from the on-disk cache while still fresh.
     Returns a list of hashtag strings, or None on failure.
     """
+    return _cached(
+        f"html|{country_code}|{period}",
+        CACHE_TTL_TRENDING,
+        "HTML",
+        lambda: _fetch_via_html_live(country_code, period),
+    )
+
+
+def _fetch_via_html_live(country_code, period):
+    """Uncached page fetch + parse behind fetch_via_html()."""
     url = "https://ads.tiktok.com/business/creativecenter/inspiration/popular/hashtag/pc/en"
 
     params = {}
@@ -152,49 +453,66 @@ def fetch_via_html(country_code="", period=7):
     if period:
         params["period"] = period
 
+    validator_key = f"{url}|{country_code}|{period}"
+    validators = _load_html_validators()
+    previous = validators.get(validator_key)
+
+    conditional_headers = {}
+    if previous:
+        if previous.get("etag"):
+            conditional_headers["If-None-Match"] = previous["etag"]
+        if previous.get("last_modified"):
+            conditional_headers["If-Modified-Since"] = previous["last_modified"]
+
+    resp = None
     try:
-        resp = requests.get(url, headers=HEADERS, params=params, timeout=20)
+        # Streamed, so the embedded JSON can be scanned while the page is
+        # still downloading (it sits in a <script> near the top).
+        resp = _polite_get(url, params=params, headers=conditional_headers, timeout=20, stream=True)
+        if resp.status_code == 304 and previous:
+            print(f"  [HTML] ✅ Page not modified — reusing {len(previous['hashtags'])} hashtags")
+            return previous["hashtags"]
         if resp.status_code != 200:
             print(f"  [HTML] HTTP {resp.status_code}")
             return None
 
-        soup = BeautifulSoup(resp.text, "html.parser")
         hashtags = []
-
-        # Strategy A: Look for hashtag text in the structured list items
-        # The page renders hashtags as "# hashtagname" in heading/link elements
-        for el in soup.find_all(["a", "div", "span", "h3", "p"]):
-            text = el.get_text(strip=True)
-            # Match patterns like "# shabebarat" or "#home"
-            if text.startswith("# ") or text.startswith("#"):
-                tag = text.replace("# ", "#").strip()
-                if tag.startswith("#") and len(tag) > 1 and " " not in tag:
-                    if tag.lower() not in [h.lower() for h in hashtags]:
-                        hashtags.append(tag)
-
-        # Strategy B: Parse from links like /hashtag/HASHTAGNAME/pc/en
-        if len(hashtags) < 5:
-            for link in soup.find_all("a", href=True):
-                href = link["href"]
-                match = re.search(r"/hashtag/([^/?]+)", href)
-                if match:
-                    name = match.group(1)
-                    tag = f"#{name}"
-                    if tag.lower() not in [h.lower() for h in hashtags]:
-                        hashtags.append(tag)
-
-        # Strategy C: Look for JSON data embedded in script tags
+        seen = set()   # lowercased tags already in `hashtags`
+
+        body = bytearray()
+        scan_from = 0
+
+        # Strategy C: Look for JSON data embedded in script tags.
+        # This is the most reliable source and a plain byte pattern, so it
+        # runs first, straight over the raw bytes as each chunk arrives —
+        # no DOM needed, and we stop downloading once we have enough.
+        for chunk in resp.iter_content(chunk_size=16 * 1024):
+            body += chunk
+            for match in _HASHTAG_JSON_RE_BYTES.finditer(body, scan_from):
+                tag = "#" + match.group(1).decode("utf-8", errors="replace")
+                _dedup_append(tag, hashtags, seen)
+                scan_from = match.end()
+            # Rescan the tail next time in case a match was cut by the chunk boundary
+            scan_from = max(scan_from, len(body) - 512)
+            if len(hashtags) >= MAX_HASHTAGS:
+                break
+
+        # Only build the DOM if the embedded JSON didn't give us enough
+        # (never after an early stop, so `body` is the whole page here)
         if len(hashtags) < 5:
-            for script in soup.find_all("script"):
-                script_text = script.string or ""
-                # Look for hashtag_name in JSON blobs
-                for match in re.finditer(r'"hashtag_name"\s*:\s*"([^"]+)"', script_text):
-                    tag = f"#{match.group(1)}"
-                    if tag.lower() not in [h.lower() for h in hashtags]:
-                        hashtags.append(tag)
+            _parse_hashtags_from_dom(bytes(body), hashtags, seen)
 
         if hashtags:
             print(f"  [HTML] ✅ Parsed {len(hashtags)} hashtags from page HTML")
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if etag or last_modified:
+                validators[validator_key] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "hashtags": hashtags,
+                }
+                _save_html_validators(validators)
             return hashtags
         else:
             print("  [HTML] No hashtags found in page HTML")
@@ -204,54 +522,97 @@ def fetch_via_html(country_code="", period=7):
         print(f"  [HTML] Error: {e}")
         return None
 
+    finally:
+        if resp is not None:
+            resp.close()   # Releases the connection even if we stopped reading early
+
+
+def _parse_hashtags_from_dom(body, hashtags, seen):
+    """
+    DOM-based fallback for fetch_via_html (Strategies A and B). Appends any
+    hashtags found in the page `body` to `hashtags`, deduped via `seen`.
+    """
+    soup = BeautifulSoup(body, HTML_PARSER)
+
+    # Strategy A: Look for hashtag text in the structured list items
+    # The page renders hashtags as "# hashtagname" in heading/link elements.
+    # Only elements holding a "#"-prefixed text node can match, so start
+    # from those text nodes and climb through their ancestors (skipping
+    # wrappers like <b>/<strong>) to the nearest a/div/span/h3/p whose full
+    # text forms a hashtag (handles "#" and the name split across tags).
+    for node in soup.find_all(string=lambda s: s.lstrip().startswith("#")):
+        for el in node.parents:
+            if el.name not in ("a", "div", "span", "h3", "p"):
+                continue
+            text = el.get_text(strip=True)
+            if not text.startswith("#"):
+                break
+            # Match patterns like "# shabebarat" or "#home"
+            tag = text.replace("# ", "#").strip()
+            if len(tag) > 1 and " " not in tag:
+                _dedup_append(tag, hashtags, seen)
+                break
+
+    # Strategy B: Parse from links like /hashtag/HASHTAGNAME/pc/en
+    if len(hashtags) < 5:
+        for link in soup.select('a[href*="/hashtag/"]'):
+            match = _HASHTAG_HREF_RE.search(link["href"])
+            if match:
+                tag = f"#{match.group(1)}"
+                _dedup_append(tag, hashtags, seen)
+
 
 # ─────────────────────────────────────────────
 # Method 3: Static fallback database
 # ─────────────────────────────────────────────
 
+# Built once at import; tuples so the shared copy can't be mutated by callers
+_FALLBACK = {
+    "general": (
+        "#fyp", "#foryou", "#viral", "#trending", "#foryoupage",
+        "#tiktok", "#xyzbca", "#tiktokviral", "#viralvideo", "#fypシ",
+    ),
+    "fitness": (
+        "#fitness", "#workout", "#gym", "#fitfam", "#healthylifestyle",
+        "#weightloss", "#fitnessmotivation", "#health", "#wellness",
+        "#fittok", "#gymtok", "#motivation",
+    ),
+    "food": (
+        "#food", "#foodie", "#cooking", "#recipe", "#foodtok",
+        "#baking", "#chef", "#foodporn", "#homecooking", "#easyrecipe",
+        "#cookingtiktok", "#yummy",
+    ),
+    "lifestyle": (
+        "#beauty", "#makeup", "#skincare", "#beautytips", "#makeuptutorial",
+        "#beautytok", "#skincareroutine", "#grwm", "#beautyhacks",
+        "#skintok", "#makeupartist",
+    ),
+    "fashion": (
+        "#fashion", "#style", "#ootd", "#outfit", "#streetstyle",
+        "#fashiontok", "#fashioninspo", "#outfitinspo", "#styleinspo",
+        "#fashiontrends", "#fashionblogger",
+    ),
+    "tech": (
+        "#tech", "#technology", "#gaming", "#gamer", "#ai",
+        "#techtok", "#gamedev", "#pc", "#gamingsetup", "#techreview",
+        "#esports", "#twitch",
+    ),
+    "travel": (
+        "#travel", "#traveltok", "#adventure", "#wanderlust", "#vacation",
+        "#explore", "#traveling", "#travelgram", "#travelphotography",
+        "#travelblogger", "#travelvlog",
+    ),
+    "business": (
+        "#business", "#entrepreneur", "#marketing", "#money", "#investing",
+        "#financetok", "#businesstips", "#hustle", "#stocks",
+        "#entrepreneurship", "#sidehustle", "#moneytok",
+    ),
+}
+
+
 def get_fallback_data():
-    """Last resort: hardcoded hashtag sets that are always valid."""
-    return {
-        "general": [
-            "#fyp", "#foryou", "#viral", "#trending", "#foryoupage",
-            "#tiktok", "#xyzbca", "#tiktokviral", "#viralvideo", "#fypシ",
-        ],
-        "fitness": [
-            "#fitness", "#workout", "#gym", "#fitfam", "#healthylifestyle",
-            "#weightloss", "#fitnessmotivation", "#health", "#wellness",
-            "#fittok", "#gymtok", "#motivation",
-        ],
-        "food": [
-            "#food", "#foodie", "#cooking", "#recipe", "#foodtok",
-            "#baking", "#chef", "#foodporn", "#homecooking", "#easyrecipe",
-            "#cookingtiktok", "#yummy",
-        ],
-        "lifestyle": [
-            "#beauty", "#makeup", "#skincare", "#beautytips", "#makeuptutorial",
-            "#beautytok", "#skincareroutine", "#grwm", "#beautyhacks",
-            "#skintok", "#makeupartist",
-        ],
-        "fashion": [
-            "#fashion", "#style", "#ootd", "#outfit", "#streetstyle",
-            "#fashiontok", "#fashioninspo", "#outfitinspo", "#styleinspo",
-            "#fashiontrends", "#fashionblogger",
-        ],
-        "tech": [
-            "#tech", "#technology", "#gaming", "#gamer", "#ai",
-            "#techtok", "#gamedev", "#pc", "#gamingsetup", "#techreview",
-            "#esports", "#twitch",
-        ],
-        "travel": [
-            "#travel", "#traveltok", "#adventure", "#wanderlust", "#vacation",
-            "#explore", "#traveling", "#travelgram", "#travelphotography",
-            "#travelblogger", "#travelvlog",
-        ],
-        "business": [
-            "#business", "#entrepreneur", "#marketing", "#money", "#investing",
-            "#financetok", "#businesstips", "#hustle", "#stocks",
-            "#entrepreneurship", "#sidehustle", "#moneytok",
-        ],
-    }
+    """Last resort: hardcoded hashtag sets that are always valid (fresh lists each call)."""
+    return {key: list(tags) for key, tags in _FALLBACK.items()}
 
 
 # ─────────────────────────────────────────────
@@ -267,52 +628,68 @@ def scrape_all_hashtags():
     website_data = {}
     source = "unknown"
 
-    # ── Attempt 1: API method (try each industry) ──
+    # ── Attempts 1 & 2: API (every industry), then HTML (general only) if needed ──
     print("\n🔌 Attempting TikTok Creative Center API...")
     api_success_count = 0
-
-    for industry_name, industry_id in INDUSTRY_IDS.items():
-        web_key = WEBSITE_KEY_MAP.get(industry_name)
-        if not web_key:
-            continue
-
-        tags = fetch_via_api(
-            industry_name=industry_name,
-            industry_id=industry_id,
-            country_code=COUNTRY_CODE,
-            period=PERIOD,
-            limit=50,
-        )
-        if tags:
-            # Merge into existing key (e.g., Games + Tech both map to "tech")
-            if web_key in website_data:
-                existing = set(t.lower() for t in website_data[web_key])
+    html_tags = None
+
+    industries = [
+        (name, industry_id) for name, industry_id in INDUSTRY_IDS.items()
+        if WEBSITE_KEY_MAP.get(name)
+    ]
+
+    # The industry calls are independent, so overlap their network waits.
+    # A small worker pool plus the per-host token bucket keep us polite.
+    with ThreadPoolExecutor(max_workers=API_CONCURRENCY) as pool:
+        api_futures = [
+            pool.submit(
+                fetch_via_api,
+                industry_name=industry_name,
+                industry_id=industry_id,
+                country_code=COUNTRY_CODE,
+                period=PERIOD,
+                limit=50,
+            )
+            for industry_name, industry_id in industries
+        ]
+
+        # "All" is submitted first, so it is normally back while the other
+        # industries are still in flight. Only if it came back short do we
+        # start the HTML scrape, overlapping it with the rest of the fan-out.
+        html_future = None
+        general_tags = next(
+            future for (industry_name, _), future in zip(industries, api_futures)
+            if WEBSITE_KEY_MAP[industry_name] == "general"
+        ).result()
+        if not general_tags or len(general_tags) < 5:
+            print("\n🌐 API general list is short — attempting HTML scrape of Creative Center page...")
+            html_future = pool.submit(fetch_via_html, country_code=COUNTRY_CODE, period=PERIOD)
+
+        # Merge in INDUSTRY_IDS order so output stays deterministic.
+        # Each key keeps its own lowercase seen-set, so a second industry on
+        # the same key (e.g., Games + Tech both map to "tech") is O(1) per tag.
+        seen_per_key = {}
+        for (industry_name, _), future in zip(industries, api_futures):
+            web_key = WEBSITE_KEY_MAP[industry_name]
+            tags = future.result()
+            if tags:
+                merged = website_data.setdefault(web_key, [])
+                seen = seen_per_key.setdefault(web_key, set())
                 for t in tags:
-                    if t.lower() not in existing:
-                        website_data[web_key].append(t)
-                        existing.add(t.lower())
-            else:
-                website_data[web_key] = tags
-            api_success_count += 1
+                    _dedup_append(t, merged, seen)
+                api_success_count += 1
 
-        # Be polite — small delay between API calls
-        time.sleep(0.5)
+        if html_future is not None:
+            html_tags = html_future.result()
 
     if api_success_count > 0:
         source = "api"
         print(f"\n✅ API method succeeded for {api_success_count}/{len(INDUSTRY_IDS)} industries")
 
-    # ── Attempt 2: HTML scrape (general trending only) ──
-    if "general" not in website_data or len(website_data.get("general", [])) < 5:
-        print("\n🌐 Attempting HTML scrape of Creative Center page...")
-        html_tags = fetch_via_html(country_code=COUNTRY_CODE, period=PERIOD)
-        if html_tags:
-            website_data["general"] = html_tags
-            if source == "unknown":
-                source = "html"
-            else:
-                source = "api+html"
-            print(f"✅ HTML method got {len(html_tags)} general trending hashtags")
+    if html_tags:
+        website_data["general"] = html_tags
+        source = "html" if source == "unknown" else "api+html"
+        print(f"✅ HTML method got {len(html_tags)} general trending hashtags")
 
     # ── Attempt 3: Static fallback ──
     if not website_data or all(len(v) < 3 for v in website_data.values()):
@@ -320,12 +697,15 @@ def scrape_all_hashtags():
         website_data = get_fallback_data()
         source = "fallback"
     else:
-        # Fill in any missing categories from fallback so the site always has data
-        fallback = get_fallback_data()
-        for key, tags in fallback.items():
-            if key not in website_data or len(website_data[key]) < 3:
+        # Fill in any missing categories from fallback so the site always has data.
+        # Only categories the fallback can fill are checked (in fallback order,
+        # so the JSON stays stable), and it's only built if one needs filling.
+        missing = [key for key in _FALLBACK if len(website_data.get(key, ())) < 3]
+        if missing:
+            fallback = get_fallback_data()
+            for key in missing:
                 print(f"  Filling missing category '{key}' from fallback")
-                website_data[key] = tags
+                website_data[key] = fallback[key]
 
     return website_data, source
 
@@ -340,12 +720,21 @@ def save_to_json(website_data, source, filename="hashtags.json"):
             "period_days": PERIOD,
         }
     }
+    if _CACHE_HIT_FETCHED_AT:
+        # Some categories came from the on-disk cache rather than this run
+        oldest = datetime.fromtimestamp(min(_CACHE_HIT_FETCHED_AT), timezone.utc)
+        output["_meta"]["cached_data_from"] = oldest.strftime("%Y-%m-%d %H:%M:%S UTC")
     # Add each category
     for key, tags in website_data.items():
         output[key] = tags
 
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    if orjson:
+        # orjson formats in C and returns UTF-8 bytes — write them as-is
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
 
     total = sum(len(v) for k, v in website_data.items() if k != "_meta")
     print(f"\n📄 Saved {filename}")
@@ -355,10 +744,15 @@ def save_to_json(website_data, source, filename="hashtags.json"):
 
 
 def save_to_excel(website_data, source, filename=None):
-    """Save to formatted Excel file (optional — nice for manual review)."""
+    """
+    Save to formatted Excel file (optional — nice for manual review).
+    pandas/openpyxl are imported here, not at module level, so runs with
+    --no-excel never pay their import cost.
+    """
     try:
         import pandas as pd
         from openpyxl.styles import Font, PatternFill, Alignment
+        from openpyxl.utils import get_column_letter
     except ImportError:
         print("⚠️  pandas/openpyxl not installed — skipping Excel export")
         return
@@ -366,18 +760,14 @@ def save_to_excel(website_data, source, filename=None):
     if filename is None:
         filename = f"tiktok_hashtags_{datetime.now().strftime('%Y%m%d')}.xlsx"
 
-    rows = []
-    for category, tags in website_data.items():
-        for rank, tag in enumerate(tags, 1):
-            rows.append({
-                "rank": rank,
-                "hashtag": tag,
-                "category": category,
-                "scraped_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "source": source,
-            })
-
-    df = pd.DataFrame(rows)
+    # Build whole columns at once rather than one dict per row
+    df = pd.DataFrame({
+        "hashtag": list(chain.from_iterable(website_data.values())),
+        "category": list(chain.from_iterable([category] * len(tags) for category, tags in website_data.items())),
+    })
+    df.insert(0, "rank", df.groupby("category", sort=False).cumcount() + 1)
+    df["scraped_date"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    df["source"] = source
 
     with pd.ExcelWriter(filename, engine="openpyxl") as writer:
         df.to_excel(writer, sheet_name="All Hashtags", index=False)
@@ -393,13 +783,17 @@ def save_to_excel(website_data, source, filename=None):
             cell.font = header_font
             cell.alignment = Alignment(horizontal="center", vertical="center")
 
-        for col in ws.columns:
-            max_len = max(len(str(c.value or "")) for c in col)
-            ws.column_dimensions[col[0].column_letter].width = min(max_len + 3, 50)
+        # Size columns from the DataFrame (vectorized string lengths) rather
+        # than scanning every worksheet cell; reused for the category sheets.
+        widths = {
+            get_column_letter(i): min(max(df[column].astype(str).str.len().max(), len(column)) + 3, 50)
+            for i, column in enumerate(df.columns, 1)
+        }
+        for letter, width in widths.items():
+            ws.column_dimensions[letter].width = width
 
-        # Per-category sheets
-        for category in df["category"].unique():
-            cat_df = df[df["category"] == category]
+        # Per-category sheets (one grouping pass instead of a mask per category)
+        for category, cat_df in df.groupby("category", sort=False):
             sheet_name = category[:31]  # Excel 31-char limit
             cat_df.to_excel(writer, sheet_name=sheet_name, index=False)
 
@@ -408,6 +802,8 @@ def save_to_excel(website_data, source, filename=None):
                 cell.fill = header_fill
                 cell.font = header_font
                 cell.alignment = Alignment(horizontal="center", vertical="center")
+            for letter, width in widths.items():
+                cat_ws.column_dimensions[letter].width = width
 
     print(f"📊 Saved {filename} ({len(df)} rows across {df['category'].nunique()} categories)")
 
@@ -416,20 +812,37 @@ def save_to_excel(website_data, source, filename=None):
 # Entry point
 # ─────────────────────────────────────────────
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fetch trending hashtags from TikTok's Creative Center.")
+    parser.add_argument(
+        "--no-excel",
+        action="store_true",
+        help="skip the Excel export (and the pandas/openpyxl import it needs)",
+    )
+    args = parser.parse_args(argv)
+
     print("=" * 60)
     print("  TikTok Trending Hashtags Scraper")
     print(f"  {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 60)
 
     # Scrape
-    website_data, source = scrape_all_hashtags()
+    try:
+        website_data, source = scrape_all_hashtags()
+    finally:
+        # Saved once the worker pool is done, so no thread is mid-update on
+        # the jar; includes whatever the API calls (and any HTML fetch) set.
+        _save_cookies()
+        SESSION.close()
+        if HTTP2_CLIENT is not None:
+            HTTP2_CLIENT.close()
 
     # Save JSON (this is what the website reads)
     save_to_json(website_data, source, "hashtags.json")
 
     # Save Excel (nice for review / archives)
-    save_to_excel(website_data, source)
+    if not args.no_excel:
+        save_to_excel(website_data, source)
 
     print(f"\n{'=' * 60}")
     print(f"  ✅ Done! Source: {source}")